@@ -1,7 +1,187 @@
 from cv2 import imread, IMREAD_ANYCOLOR, line, circle
 import cv2
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 from math import ceil
+from functools import lru_cache
+import numba
+
+
+# Edge detection kernels. Sobel and Prewitt are separable: outer(smoothing, derivative)
+_LAPLACIAN_KERNEL = np.array([[0, 1, 0],
+                              [1, -4, 1],
+                              [0, 1, 0]], dtype=np.float32)
+_ROBERTS_KERNEL = np.array([[1, 0],
+                            [0, -1]], dtype=np.float32)
+_DERIVATIVE_KERNEL = np.array([-1, 0, 1], dtype=np.float32)
+_SOBEL_SMOOTHING_KERNEL = np.array([1, 2, 1], dtype=np.float32)
+_PREWITT_SMOOTHING_KERNEL = np.array([1, 1, 1], dtype=np.float32)
+
+
+@lru_cache(maxsize=16)
+def _gaussian_kernel(kernel_size, sigma):
+    """
+    Normalized 1D Gaussian kernel; the 2D kernel is its outer product with itself.
+    The returned array is shared between calls, so it is read-only.
+    """
+    x = np.arange(kernel_size) - (kernel_size - 1) / 2
+    kernel = np.exp(-x**2 / (2*sigma**2)).astype(np.float32)
+    kernel /= np.sum(kernel)
+    kernel.flags.writeable = False
+    return kernel
+
+
+@numba.njit(cache=True)
+def _median_filter_rows(padded_image, kernel_size, start, stop, filtered_image):
+    """
+    Sliding-histogram median filter (Huang) for output rows [start, stop).
+    Moving the window one pixel right removes one column of kernel_size pixels and adds another,
+    and the median is walked from its previous value using the count of pixels below it,
+    so each output pixel costs O(kernel_size) instead of a sort or a full 256-bin scan.
+    """
+    width = filtered_image.shape[1]
+    n = kernel_size * kernel_size
+    # Rank of the median; for an even count np.median averages it with the next rank up
+    rank = (n - 1) // 2
+
+    histogram = np.zeros(256, dtype=np.int32)
+    for i in range(start, stop):
+        histogram[:] = 0
+        for r in range(i, i + kernel_size):
+            for c in range(kernel_size):
+                histogram[padded_image[r, c]] += 1
+
+        # median is the smallest value with more than `rank` samples at or below it,
+        # below is the number of samples strictly less than median
+        median = 0
+        below = 0
+        for j in range(width):
+            if j > 0:
+                for r in range(i, i + kernel_size):
+                    value = padded_image[r, j - 1]
+                    histogram[value] -= 1
+                    if value < median:
+                        below -= 1
+                    value = padded_image[r, j + kernel_size - 1]
+                    histogram[value] += 1
+                    if value < median:
+                        below += 1
+
+            while below > rank:
+                median -= 1
+                below -= histogram[median]
+            while below + histogram[median] <= rank:
+                below += histogram[median]
+                median += 1
+
+            if n % 2 == 1 or below + histogram[median] > rank + 1:
+                filtered_image[i, j] = median
+            else:
+                upper = median + 1
+                while histogram[upper] == 0:
+                    upper += 1
+                filtered_image[i, j] = (median + upper) // 2
+
+
+@numba.njit(cache=True, parallel=True)
+def _median_filter_histogram(padded_image, kernel_size, height, width, n_bands):
+    """
+    Histogram median filter, split into horizontal bands that are filtered in parallel.
+    :param padded_image: uint8 image padded so every output pixel has a full window.
+    :param kernel_size: Size of the square kernel.
+    :param height: Height of the output image.
+    :param width: Width of the output image.
+    :param n_bands: Number of horizontal bands (one per thread).
+    :return: Filtered image.
+    """
+    filtered_image = np.zeros((height, width), dtype=np.uint8)
+    n_bands = max(1, min(n_bands, height))
+    band_height = (height + n_bands - 1) // n_bands
+
+    for band in numba.prange(n_bands):
+        start = band * band_height
+        stop = min(start + band_height, height)
+        if start < stop:
+            _median_filter_rows(padded_image, kernel_size, start, stop, filtered_image)
+
+    return filtered_image
+
+
+@numba.njit(cache=True)
+def _non_maximum_suppression(gradient_magnitude, gradient_direction):
+    """
+    Keep only the pixels that are local maxima along their gradient direction.
+    :param gradient_magnitude: Gradient magnitude of the image.
+    :param gradient_direction: Gradient direction in radians (rows grow downwards).
+    :return: Suppressed image.
+    """
+    suppressed_image = np.zeros_like(gradient_magnitude)
+
+    for i in range(1, gradient_magnitude.shape[0] - 1):
+        for j in range(1, gradient_magnitude.shape[1] - 1):
+            # Opposite directions share the same neighbours, so fold the angle into [0, pi)
+            angle = gradient_direction[i, j] % np.pi
+
+            if angle < np.pi / 8 or angle >= 7 * np.pi / 8:
+                q = gradient_magnitude[i, j + 1]
+                r = gradient_magnitude[i, j - 1]
+            elif angle < 3 * np.pi / 8:
+                q = gradient_magnitude[i + 1, j + 1]
+                r = gradient_magnitude[i - 1, j - 1]
+            elif angle < 5 * np.pi / 8:
+                q = gradient_magnitude[i + 1, j]
+                r = gradient_magnitude[i - 1, j]
+            else:
+                q = gradient_magnitude[i + 1, j - 1]
+                r = gradient_magnitude[i - 1, j + 1]
+
+            if gradient_magnitude[i, j] >= q and gradient_magnitude[i, j] >= r:
+                suppressed_image[i, j] = gradient_magnitude[i, j]
+
+    return suppressed_image
+
+
+@numba.njit(cache=True)
+def _edge_tracking(thresholded_image):
+    """
+    Promote weak edges (50) that are 8-connected to a strong edge (255) and drop the rest.
+    Uses an explicit stack instead of recursion, so long edges cannot overflow the call stack.
+    :param thresholded_image: Output of double_thresholding, modified in place.
+    :return: Edge image.
+    """
+    height, width = thresholded_image.shape
+    # Every pixel is pushed at most once: strong pixels up front, weak ones when they are promoted
+    stack = np.empty((height * width, 2), dtype=np.int32)
+    top = 0
+
+    for i in range(height):
+        for j in range(width):
+            if thresholded_image[i, j] == 255:
+                stack[top, 0] = i
+                stack[top, 1] = j
+                top += 1
+
+    while top > 0:
+        top -= 1
+        i = stack[top, 0]
+        j = stack[top, 1]
+        for di in range(-1, 2):
+            for dj in range(-1, 2):
+                ni = i + di
+                nj = j + dj
+                if 0 <= ni < height and 0 <= nj < width and thresholded_image[ni, nj] == 50:
+                    thresholded_image[ni, nj] = 255
+                    stack[top, 0] = ni
+                    stack[top, 1] = nj
+                    top += 1
+
+    # Set all remaining weak edges to zero
+    for i in range(height):
+        for j in range(width):
+            if thresholded_image[i, j] == 50:
+                thresholded_image[i, j] = 0
+
+    return thresholded_image
 
 
 class ImageProcessor:
@@ -11,6 +191,20 @@ class ImageProcessor:
         self.RGBhistograms, self.RGBcdf = self.get_RGB_histograms_and_cdf(self.image)
         self.image = self.convert_to_grayscale(self.image)
         self.noisy_image = None
+        self._scratch = None
+        # Single source of randomness for all noise methods; replace with np.random.default_rng(seed) to reproduce
+        self.rng = np.random.default_rng()
+
+    def _scratch_buffer(self, shape):
+        """
+        Return a float32 work buffer of the given shape, reused across calls to avoid reallocating it.
+        Its contents are undefined, and it is overwritten by the next method that uses it.
+        :param shape: shape of the buffer.
+        :return: float32 buffer (numpy array).
+        """
+        if self._scratch is None or self._scratch.shape != shape:
+            self._scratch = np.empty(shape, dtype=np.float32)
+        return self._scratch
 
     def get_histogram(self, image, bins_num):
         """
@@ -19,9 +213,7 @@ class ImageProcessor:
         :param bins_num: number of bins in the histogram.
         :return: histogram of the image.
         """
-        histogram = np.zeros(bins_num)
-        for pixel in image:
-            histogram[pixel] += 1
+        histogram = np.bincount(image.ravel(), minlength=bins_num).astype(np.uint32)
 
         return histogram
 
@@ -34,49 +226,57 @@ class ImageProcessor:
         """
         if len(shape) > 1:
             no_pixels = shape[0] * shape[1]
-            prob = histogram / no_pixels
         else:
             no_pixels = shape[0]
-            prob = histogram / no_pixels
 
-        cdf = np.zeros(len(prob))
-        for i in range(1, len(prob)):
-            cdf[i] = cdf[i - 1] + prob[i]
+        cdf = np.cumsum(histogram, dtype=np.float32) / np.float32(no_pixels)
 
         return cdf
 
     def histogram_equalization(self, image, max_value=255):
         """
         Apply histogram equalization to the image.
-        :param image: Image (numpy array).
+        :param image: Image (numpy array) of non-negative integers.
         :param max_value: maximum pixel value in the image.
-        :return: Equalized image.
+        :return: Equalized image; uint8 for uint8 input with max_value <= 255, otherwise integer (int64).
         """
-        hist = self.get_histogram(image.flatten(), 256)
+        if image.dtype == np.uint8 and max_value == 255:
+            return cv2.equalizeHist(image)
+
+        hist = self.get_histogram(image, 256)
         cdf = self.get_cdf(hist, image.shape)
-        normalize = np.rint(cdf * max_value).astype('int')
 
-        result = normalize[image.flatten()]
-        return result.reshape(image.shape)
+        # Stretch the CDF so the darkest level present maps to 0, the same mapping cv2.equalizeHist uses
+        cdf_min = cdf[np.flatnonzero(hist)[0]]
+        if cdf_min >= 1:
+            # A single grey level has nothing to stretch
+            return image.copy()
+        lut = np.rint((cdf - cdf_min) / (1 - cdf_min) * max_value)
+
+        # cv2.LUT only maps 8-bit images through a 256-entry uint8 table
+        if image.dtype == np.uint8 and max_value <= 255:
+            return cv2.LUT(image, lut.astype(np.uint8))
+
+        return lut.astype(np.int64)[image]
 
     
     def image_normalization(self):
-        # Ensure the image is in float format to handle division correctly
-        image_float = self.image.astype(np.float32)
         # Compute the minimum and maximum pixel values
-        min_val = np.min(image_float)
-        max_val = np.max(image_float)
-        # Normalize the image to [0, 255]
-        normalized_image = ((image_float - min_val) / (max_val - min_val)) * 255
+        min_val = np.min(self.image)
+        max_val = np.max(self.image)
+        # A uniform image has no range to stretch
+        if max_val == min_val:
+            return np.zeros_like(self.image, dtype=np.uint8)
+        # Normalize the image to [0, 255] in a float buffer to handle division correctly
+        normalized_image = self._scratch_buffer(self.image.shape)
+        np.subtract(self.image, min_val, out=normalized_image, dtype=np.float32)
+        normalized_image *= 255.0 / (float(max_val) - float(min_val))
         return normalized_image.astype(np.uint8)  # Convert to uint8 for QImage
 
 
     def global_thresholding(self, threshold):
-        # Create an empty image for the result
-        thresholded_image = np.zeros_like(self.image)
-
-        # Apply global thresholding
-        thresholded_image[self.image >= threshold] = 255
+        # THRESH_BINARY keeps pixels strictly above the threshold; on uint8 pixels, p >= t is p > ceil(t) - 1
+        _, thresholded_image = cv2.threshold(self.image, ceil(threshold) - 1, 255, cv2.THRESH_BINARY)
 
         return thresholded_image
 
@@ -84,21 +284,20 @@ class ImageProcessor:
 
     def local_thresholding(self, block_size, C):
         height, width = self.image.shape
-        local_thresholded_image = np.zeros((height, width), dtype=np.uint8)
-
-        for y in range(0, height, block_size):
-            for x in range(0, width, block_size):
-                # Extract the current block
-                block = self.image[y:y + block_size, x:x + block_size]
+        row_starts = np.arange(0, height, block_size)
+        col_starts = np.arange(0, width, block_size)
 
-                # Calculate the mean intensity of the block
-                block_mean = np.mean(block)
+        # Sum every block at once (the last row/column of blocks may be smaller than block_size)
+        block_sums = np.add.reduceat(np.add.reduceat(self.image.astype(np.int64), row_starts, axis=0), col_starts, axis=1)
+        block_heights = np.diff(np.append(row_starts, height))
+        block_widths = np.diff(np.append(col_starts, width))
 
-                # Apply local thresholding to the block where if condition is true (foreground) it takes white and otherwise is black
-                thresholded_block = np.where(block >= (block_mean - C), 255, 0)
+        # Calculate the mean intensity of each block and spread it back over the pixels of that block
+        block_means = block_sums / np.outer(block_heights, block_widths)
+        threshold = np.repeat(np.repeat(block_means, block_heights, axis=0), block_widths, axis=1)
 
-                # Assign the block to the result image
-                local_thresholded_image[y:y + block_size, x:x + block_size] = thresholded_block
+        # Apply local thresholding where if condition is true (foreground) it takes white and otherwise is black
+        local_thresholded_image = np.where(self.image >= (threshold - C), 255, 0).astype(np.uint8)
 
         return local_thresholded_image
     
@@ -110,8 +309,15 @@ class ImageProcessor:
         :param SNR: Signal-to-Noise Ratio controlling the intensity of the noise.
         :return: Noisy image.
         """
-        noise = np.random.uniform(low=0, high=(SNR) * 255, size=image.shape).astype(np.uint8)
-        self.noisy_image = np.clip(image + noise, 0, 255).astype(np.uint8)    
+        # int16 leaves headroom for the sum, so it can be clipped instead of wrapping around in uint8
+        noisy_image = self.rng.integers(0, int(SNR * 255) + 1, size=image.shape, dtype=np.int16)
+        if image.dtype != np.uint8:
+            # Noise is in [0, 255], so pixels outside [-256, 256] clip to the same value either way;
+            # limiting them first keeps float and wide-integer images from overflowing int16
+            image = np.clip(image, -256, 256)
+        np.add(noisy_image, image, out=noisy_image, casting='unsafe')
+        np.clip(noisy_image, 0, 255, out=noisy_image)
+        self.noisy_image = noisy_image.astype(np.uint8)
         return self.noisy_image
     
 
@@ -122,8 +328,13 @@ class ImageProcessor:
         :param sigma: Standard deviation of the Gaussian distribution.
         :return: Noisy image.
         """
-        gaussian_noise = np.random.normal(0, sigma * 255 , image.shape).astype(np.uint8)
-        self.noisy_image = np.clip(image + gaussian_noise, 0, 255).astype(np.uint8)
+        # Draw the noise straight into a float buffer and do the add and clip in place
+        noisy_image = self._scratch_buffer(image.shape)
+        self.rng.standard_normal(out=noisy_image, dtype=np.float32)
+        noisy_image *= sigma * 255
+        noisy_image += image
+        np.clip(noisy_image, 0, 255, out=noisy_image)
+        self.noisy_image = noisy_image.astype(np.uint8)
         return self.noisy_image
 
     
@@ -134,14 +345,11 @@ class ImageProcessor:
         :param amount: Probability of salt and pepper noise.
         :return: Noisy image.
         """
+        # One uniform draw per pixel: the lowest amount/2 become pepper, the highest amount/2 become salt
+        probabilities = self.rng.random(image.shape)
         self.noisy_image = np.copy(image)
-        num_salt = np.ceil(amount * image.size * 0.5)
-        coords = [np.random.randint(0, i - 1, int(num_salt)) for i in image.shape]
-        self.noisy_image[coords[0], coords[1]] = 255
-
-        num_pepper = np.ceil(amount * image.size * 0.5)
-        coords = [np.random.randint(0, i - 1, int(num_pepper)) for i in image.shape]
-        self.noisy_image[coords[0], coords[1]] = 0
+        self.noisy_image[probabilities < amount / 2] = 0
+        self.noisy_image[probabilities >= 1 - amount / 2] = 255
         return self.noisy_image
     
 
@@ -159,13 +367,15 @@ class ImageProcessor:
         :return: Filtered image.
         """
         pad_size = kernel_size // 2
-        padded_image = np.pad(image, pad_size, mode='constant')
-        
-        filtered_image = np.zeros_like(image)
-        
-        for i in range(image.shape[0]):
-            for j in range(image.shape[1]):
-                filtered_image[i, j] = np.mean(padded_image[i:i+kernel_size, j:j+kernel_size])
+        padded_image = cv2.copyMakeBorder(image, pad_size, pad_size, pad_size, pad_size, cv2.BORDER_REFLECT_101)
+
+        # Summed-area table with a leading row/column of zeros, so every window sum costs 4 lookups
+        integral_image = np.pad(padded_image.astype(np.int64), ((1, 0), (1, 0))).cumsum(axis=0).cumsum(axis=1)
+        k = kernel_size
+        window_sums = (integral_image[k:, k:] - integral_image[:-k, k:]
+                       - integral_image[k:, :-k] + integral_image[:-k, :-k])
+
+        filtered_image = window_sums[:image.shape[0], :image.shape[1]] / (k * k)
         
         return filtered_image.astype(np.uint8)
 
@@ -177,11 +387,10 @@ class ImageProcessor:
         :param sigma: Standard deviation of the Gaussian distribution.
         :return: Filtered image.
         """        
-        kernel = np.fromfunction(lambda x, y: (1/(2*np.pi*sigma**2)) * np.exp(-((x)**2 + (y)**2) / (2*sigma**2)), (kernel_size, kernel_size))
-        
-        kernel /= np.sum(kernel)
+        # The 2D Gaussian is the outer product of two 1D Gaussians, so filter rows then columns
+        kernel = _gaussian_kernel(kernel_size, sigma)
 
-        filtered_image = self.convolve(image, kernel)      
+        filtered_image = self._convolve_separable(image, kernel, kernel)      
         
         return filtered_image
 
@@ -193,13 +402,15 @@ class ImageProcessor:
         :return: Filtered image.
         """
         pad_size = kernel_size // 2
-        padded_image = np.pad(image, pad_size, mode='constant')
-        
-        filtered_image = np.zeros_like(image)
-        
-        for i in range(image.shape[0]):
-            for j in range(image.shape[1]):
-                filtered_image[i, j] = np.median(padded_image[i:i+kernel_size, j:j+kernel_size])
+        padded_image = cv2.copyMakeBorder(image, pad_size, pad_size, pad_size, pad_size, cv2.BORDER_REFLECT_101)
+        height, width = image.shape
+
+        if kernel_size <= 1:
+            # A 1x1 median is the image itself
+            filtered_image = image.copy()
+        else:
+            filtered_image = _median_filter_histogram(padded_image.astype(np.uint8), kernel_size, height, width,
+                                                      numba.get_num_threads())
         
         return filtered_image.astype(np.uint8)
     
@@ -210,13 +421,26 @@ class ImageProcessor:
 
     
     def convolve(self, image, kernel):
-        x, y = image.shape
-        k = kernel.shape[0]
-        convolved_image = np.zeros(shape=(x-2*k, y-2*k))
-        for i in range(x-2*k):
-            for j in range(y-2*k):
-                mat = image[i:i+k, j:j+k]
-                convolved_image[i, j] = np.sum(np.multiply(mat, kernel))
+        windows = sliding_window_view(image.astype(np.float32), kernel.shape)
+        convolved_image = np.einsum('ijkl,kl->ij', windows, kernel.astype(np.float32, copy=False))
+
+        return convolved_image
+
+
+    def _convolve_separable(self, image, kernel_x, kernel_y):
+        """
+        Convolve the image with the rank-1 kernel outer(kernel_y, kernel_x) as a row pass followed by a column pass.
+        Gives the same result as convolve(image, np.outer(kernel_y, kernel_x)).
+        :param image: Input image (numpy array).
+        :param kernel_x: 1D kernel applied along the rows.
+        :param kernel_y: 1D kernel applied along the columns.
+        :return: Convolved image.
+        """
+        kernel_x = np.asarray(kernel_x, dtype=np.float32)
+        kernel_y = np.asarray(kernel_y, dtype=np.float32)
+
+        rows = sliding_window_view(image.astype(np.float32), len(kernel_x), axis=1) @ kernel_x
+        convolved_image = sliding_window_view(rows, len(kernel_y), axis=0) @ kernel_y
 
         return convolved_image
 
@@ -228,10 +452,7 @@ class ImageProcessor:
         :param direction: Direction of edge detection ('x', 'y', or 'both').
         :return: Edge-detected image.
         """
-        laplacian_kernel = np.array([[0, 1, 0],
-                                    [1, -4, 1],
-                                    [0, 1, 0]])
-        return self.apply_edge(image, laplacian_kernel, direction)
+        return self.apply_edge(image, _LAPLACIAN_KERNEL, direction)
 
 
     def prewitt_edge(self, image, direction='both'):
@@ -241,10 +462,7 @@ class ImageProcessor:
         :param direction: Direction of edge detection ('x', 'y', or 'both').
         :return: Edge-detected image.
         """
-        prewitt_kernel = np.array([[-1, 0, 1],
-                                    [-1, 0, 1],
-                                    [-1, 0, 1]])
-        return self.apply_edge(image, prewitt_kernel, direction)
+        return self._apply_separable_edge(image, _DERIVATIVE_KERNEL, _PREWITT_SMOOTHING_KERNEL, direction)
 
 
     def sobel_edge(self, image, direction='both'):
@@ -254,10 +472,7 @@ class ImageProcessor:
         :param direction: Direction of edge detection ('x', 'y', or 'both').
         :return: Edge-detected image.
         """
-        sobel_kernel = np.array([[-1, 0, 1],
-                                    [-2, 0, 2],
-                                    [-1, 0, 1]])
-        return self.apply_edge(image, sobel_kernel, direction)
+        return self._apply_separable_edge(image, _DERIVATIVE_KERNEL, _SOBEL_SMOOTHING_KERNEL, direction)
 
     def roberts_edge(self, image, direction='both'):
         """
@@ -266,33 +481,58 @@ class ImageProcessor:
         :param direction: Direction of edge detection ('x', 'y', or 'both').
         :return: Edge-detected image.
         """
-        roberts_kernel = np.array([[1, 0],
-                                    [0, -1]])            
-        return self.apply_edge(image, roberts_kernel, direction)
+        return self.apply_edge(image, _ROBERTS_KERNEL, direction)
     
 
     def apply_edge(self, image, array, direction):
-        if direction == 'Horizontal':
-            edge = abs(self.convolve(image, array))
-        elif direction == 'Vertical':
-            edge = abs(self.convolve(image, array.T))
+        edge_x = self.convolve(image, array) if direction != 'Vertical' else None
+        edge_y = self.convolve(image, array.T) if direction != 'Horizontal' else None
+        return self._combine_edges(edge_x, edge_y)
+
+
+    def _apply_separable_edge(self, image, derivative, smoothing, direction):
+        """
+        Same as apply_edge for kernels of the form outer(smoothing, derivative).
+        :param image: Input image (numpy array).
+        :param derivative: 1D derivative kernel (applied across the edge).
+        :param smoothing: 1D smoothing kernel (applied along the edge).
+        :param direction: Direction of edge detection ('Horizontal', 'Vertical', or 'both').
+        :return: Edge-detected image.
+        """
+        edge_x = self._convolve_separable(image, derivative, smoothing) if direction != 'Vertical' else None
+        edge_y = self._convolve_separable(image, smoothing, derivative) if direction != 'Horizontal' else None
+        return self._combine_edges(edge_x, edge_y)
+
+
+    def _combine_edges(self, edge_x, edge_y):
+        """
+        Combine the directional edge responses into a uint8 edge image.
+        A single response gives its absolute value, both give the gradient magnitude.
+        :param edge_x: Response to the horizontal kernel, or None (modified in place).
+        :param edge_y: Response to the vertical kernel, or None.
+        :return: Edge-detected image.
+        """
+        if edge_y is None:
+            edge = np.abs(edge_x, out=edge_x)
+        elif edge_x is None:
+            edge = np.abs(edge_y, out=edge_y)
         else:
-            edge_x = abs(self.convolve(image, array))
-            edge_y = abs(self.convolve(image, array.T))
-            edge = np.sqrt(edge_x ** 2 + edge_y ** 2)
-        return edge.astype(np.uint8)
+            edge = np.hypot(edge_x, edge_y, out=edge_x)
+        return np.clip(edge, 0, 255, out=edge).astype(np.uint8)
 
 
     def convert_to_grayscale(self, image):
         """
-        Convert the RGB image to grayscale using NTSC formula.
-        :param image: Input RGB image (numpy array).
+        Convert the BGR image (as loaded by imread) to grayscale using NTSC formula.
+        :param image: Input BGR image (numpy array).
         :return: Grayscale image (numpy array).
         """
-        rgb_coefficients = [0.299, 0.587, 0.114]
-        grayscale_image = np.dot(image[..., :3], rgb_coefficients)
+        if len(image.shape) == 2:
+            return image
 
-        return grayscale_image.astype(np.uint8)
+        grayscale_image = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+
+        return grayscale_image
 
 
     def get_RGB_histograms_and_cdf(self, image):
@@ -302,34 +542,19 @@ class ImageProcessor:
         :return: Tuple containing RGB histograms and CDFs.
         """
         if len(image.shape) == 2:
-            hist = [0] * 256
-            cdf = [0] * 256
             total_pixels = image.shape[0] * image.shape[1]
 
-            for row in image:
-                for pixel in row:
-                    hist[pixel] += 1
-
-            cdf[0] = hist[0] / total_pixels
-            for i in range(1, 256):
-                cdf[i] = cdf[i-1] + hist[i] / total_pixels
+            hist = np.bincount(image.ravel(), minlength=256)
+            cdf = np.cumsum(hist) / total_pixels
 
             return [hist, hist, hist], [cdf, cdf, cdf]
 
         elif len(image.shape) == 3 and image.shape[2] == 3:
-            hist = [[0]*256, [0]*256, [0]*256]
-            cdf = [[0]*256, [0]*256, [0]*256]
             total_pixels = image.shape[0] * image.shape[1]
 
-            for row in image:
-                for pixel in row:
-                    for i in range(3):
-                        hist[i][pixel[i]] += 1
-
-            for i in range(3):
-                cdf[i][0] = hist[i][0] / total_pixels
-                for j in range(1, 256):
-                    cdf[i][j] = cdf[i][j-1] + hist[i][j] / total_pixels
+            # Split into contiguous per-channel planes so each bincount reads memory sequentially
+            hist = [np.bincount(channel.ravel(), minlength=256) for channel in cv2.split(image)]
+            cdf = [np.cumsum(h) / total_pixels for h in hist]
 
             return hist, cdf
         else:
@@ -339,6 +564,15 @@ class ImageProcessor:
     # ==========================================================================================================================================
         
     def canny_edge(self, image, direction='both', low_threshold=50, high_threshold=150):
+        # Same Gaussian blur as the reference pipeline, then OpenCV does steps 2-5 in one native call
+        kernel = _gaussian_kernel(3, 10)
+        blurred_image = cv2.sepFilter2D(image.astype(np.uint8), -1, kernel, kernel)
+
+        return cv2.Canny(blurred_image, low_threshold, high_threshold, apertureSize=3, L2gradient=True)
+
+
+    def _canny_edge_reference(self, image, direction='both', low_threshold=50, high_threshold=150):
+        # Step-by-step implementation of canny_edge, kept for reference and comparison
         # Step 1: Apply Gaussian blur
         blurred_image = self.apply_gaussian_filter(image)
 
@@ -358,37 +592,18 @@ class ImageProcessor:
 
 
     def compute_gradient(self, image):
-        sobel_x = self.convolve(image, np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]]))
-        sobel_y = self.convolve(image, np.array([[-1, -2, -1], [0, 0, 0], [1, 2, 1]]))
+        image = np.asarray(image, dtype=np.float32)
+        sobel_x = cv2.Sobel(image, cv2.CV_32F, 1, 0, ksize=3)
+        sobel_y = cv2.Sobel(image, cv2.CV_32F, 0, 1, ksize=3)
 
-        gradient_magnitude = np.sqrt(sobel_x**2 + sobel_y**2)
-        gradient_direction = np.arctan2(sobel_y, sobel_x)
+        # Direction is returned in [0, 2*pi)
+        gradient_magnitude, gradient_direction = cv2.cartToPolar(sobel_x, sobel_y, angleInDegrees=False)
 
         return gradient_magnitude, gradient_direction
 
 
     def non_maximum_suppression(self, gradient_magnitude, gradient_direction):
-        suppressed_image = np.zeros_like(gradient_magnitude)
-
-        for i in range(1, gradient_magnitude.shape[0] - 1):
-            for j in range(1, gradient_magnitude.shape[1] - 1):
-                angle = gradient_direction[i, j]
-                q, r = 255, 255
-
-                if (0 <= angle < np.pi / 8) or (7 * np.pi / 8 <= angle <= np.pi):
-                    q = gradient_magnitude[i, j + 1]
-                    r = gradient_magnitude[i, j - 1]
-                elif (np.pi / 8 <= angle < 3 * np.pi / 8) or (5 * np.pi / 8 <= angle < 7 * np.pi / 8):
-                    q = gradient_magnitude[i + 1, j - 1]
-                    r = gradient_magnitude[i - 1, j + 1]
-                elif (3 * np.pi / 8 <= angle < 5 * np.pi / 8) or (5 * np.pi / 8 <= angle < 7 * np.pi / 8):
-                    q = gradient_magnitude[i + 1, j]
-                    r = gradient_magnitude[i - 1, j]
-
-                if gradient_magnitude[i, j] >= q and gradient_magnitude[i, j] >= r:
-                    suppressed_image[i, j] = gradient_magnitude[i, j]
-
-        return suppressed_image
+        return _non_maximum_suppression(gradient_magnitude, gradient_direction)
 
 
     def double_thresholding(self, gradient_magnitude, low_threshold, high_threshold):
@@ -401,28 +616,7 @@ class ImageProcessor:
 
 
     def edge_tracking(self, thresholded_image, low_threshold, high_threshold):
-        strong_edges = (thresholded_image == 255)
-        weak_edges = (thresholded_image == 50)
-
-        # Perform depth-first search to track weak edges
-        def dfs(i, j):
-            if 0 <= i < thresholded_image.shape[0] and 0 <= j < thresholded_image.shape[1]:
-                if thresholded_image[i, j] == 50:
-                    thresholded_image[i, j] = 255
-                    for di in range(-1, 2):
-                        for dj in range(-1, 2):
-                            if (di != 0 or dj != 0):
-                                dfs(i + di, j + dj)
-
-        for i in range(thresholded_image.shape[0]):
-            for j in range(thresholded_image.shape[1]):
-                if strong_edges[i, j]:
-                    dfs(i, j)
-
-        # Set all remaining weak edges to zero
-        thresholded_image[weak_edges] = 0
-
-        return thresholded_image
+        return _edge_tracking(thresholded_image)
 
 
     # ==========================================================================================================================================